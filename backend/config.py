@@ -4,47 +4,67 @@ Loads environment variables and provides defaults.
 """
 
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
+def _env(name: str, default: str, show: bool = True):
+    """
+    Field whose default is read from the environment when Settings is created.
+    Pass show=False for secrets so they never show up in logs or tracebacks.
+    """
+    return field(default_factory=lambda: os.getenv(name, default), repr=show)
 
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables"""
 
     # Database
-    DATABASE_URL: str = os.getenv(
+    DATABASE_URL: str = _env(
         "DATABASE_URL",
-        "postgresql://apple_user:PostgresSecure123!@db:5432/apple_health_db"
+        "postgresql://apple_user:PostgresSecure123!@db:5432/apple_health_db",
+        show=False,
     )
 
     # JWT
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "JWTSecretKey456!")
-    ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
-        os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+    SECRET_KEY: str = _env("SECRET_KEY", "JWTSecretKey456!", show=False)
+    ALGORITHM: str = _env("ALGORITHM", "HS256")
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = field(
+        default_factory=lambda: int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
     )
 
     # Google OAuth
-    GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
-    GOOGLE_CLIENT_SECRET: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
+    GOOGLE_CLIENT_ID: str = _env("GOOGLE_CLIENT_ID", "")
+    GOOGLE_CLIENT_SECRET: str = _env("GOOGLE_CLIENT_SECRET", "", show=False)
 
     # SendGrid
-    SENDGRID_API_KEY: str = os.getenv("SENDGRID_API_KEY", "")
-    SENDER_EMAIL: str = os.getenv("SENDER_EMAIL", "noreply@apple-health-app.com")
+    SENDGRID_API_KEY: str = _env("SENDGRID_API_KEY", "", show=False)
+    SENDER_EMAIL: str = _env("SENDER_EMAIL", "noreply@apple-health-app.com")
 
     # URLs
-    BACKEND_URL: str = os.getenv("BACKEND_URL", "http://localhost:5000")
-    FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
+    BACKEND_URL: str = _env("BACKEND_URL", "http://localhost:5000")
+    FRONTEND_URL: str = _env("FRONTEND_URL", "http://localhost:3000")
 
     # Environment
-    DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    DEBUG: bool = field(
+        default_factory=lambda: os.getenv("DEBUG", "True").lower() == "true"
+    )
+    ENVIRONMENT: str = _env("ENVIRONMENT", "development")
 
     # SQLAlchemy
-    SQLALCHEMY_ECHO: bool = DEBUG  # Log SQL queries in development
+    @property
+    def SQLALCHEMY_ECHO(self) -> bool:
+        """Log SQL queries in development"""
+        return self.DEBUG
 
 
-# Create global settings instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the application settings.
+    Loads the .env file on first call only; later calls reuse the same instance.
+    """
+    load_dotenv()
+    return Settings()
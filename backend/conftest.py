@@ -3,12 +3,14 @@ Pytest configuration and fixtures.
 Shared test utilities used across all tests.
 """
 
+from types import MappingProxyType
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from database import Base, get_db
+from database import Base, get_db, make_engine
 from main import app
 
 
@@ -17,30 +19,51 @@ from main import app
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_engine():
-    """Create test database engine (in-memory SQLite)"""
-    engine = create_engine(
+    """Create test database engine (in-memory SQLite), shared by the whole session"""
+    engine = make_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # Let SQLAlchemy manage transactions itself; pysqlite's implicit
+    # BEGIN handling otherwise breaks SAVEPOINTs
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
+    engine.dispose()
 
 
 @pytest.fixture
 def test_session(test_engine):
-    """Create test database session"""
+    """
+    Create test database session.
+    Runs inside an outer transaction that is rolled back after the test;
+    session commits only release a SAVEPOINT, so tests stay isolated.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
     TestingSessionLocal = sessionmaker(
         autocommit=False,
         autoflush=False,
-        bind=test_engine,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
     )
     session = TestingSessionLocal()
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -62,25 +85,31 @@ def test_client(test_session):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+# Sample data shared read-only across the session; use dict(fixture) to mutate
+_SAMPLE_USER_DATA = {
+    "google_id": "123456789",
+    "email": "test@example.com",
+    "name": "Test User",
+    "profile_picture_url": "https://example.com/pic.jpg"
+}
+
+_SAMPLE_WORKOUT_DATA = {
+    "date": "2024-01-15",
+    "time": "10:30:00",
+    "type": "Running",
+    "duration_min": 30,
+    "calories": 250,
+    "source": "Apple Watch"
+}
+
+
+@pytest.fixture(scope="session")
 def sample_user_data():
-    """Sample user data for tests"""
-    return {
-        "google_id": "123456789",
-        "email": "test@example.com",
-        "name": "Test User",
-        "profile_picture_url": "https://example.com/pic.jpg"
-    }
+    """Sample user data for tests (read-only)"""
+    return MappingProxyType(_SAMPLE_USER_DATA)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workout_data():
-    """Sample workout data for tests"""
-    return {
-        "date": "2024-01-15",
-        "time": "10:30:00",
-        "type": "Running",
-        "duration_min": 30,
-        "calories": 250,
-        "source": "Apple Watch"
-    }
\ No newline at end of file
+    """Sample workout data for tests (read-only)"""
+    return MappingProxyType(_SAMPLE_WORKOUT_DATA)
@@ -3,18 +3,30 @@ Database connection and session management.
 Uses SQLAlchemy to connect to PostgreSQL.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from config import settings
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from config import get_settings
+
+settings = get_settings()
+
+
+def make_engine(url, **overrides):
+    """
+    Create a database engine for the given URL.
+    Connection health options only apply to server databases; SQLite
+    connections are local, so pre-ping and recycling are skipped.
+    Keyword arguments override the defaults.
+    """
+    options = {"future": True}
+    if make_url(url).get_backend_name() != "sqlite":
+        options["pool_pre_ping"] = True  # Test connection before using
+        options["pool_recycle"] = 3600   # Recycle connections every hour
+    options.update(overrides)
+    return create_engine(url, **options)
+
 
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.SQLALCHEMY_ECHO,
-    future=True,
-    pool_pre_ping=True,  # Test connection before using
-    pool_recycle=3600,   # Recycle connections every hour
-)
+engine = make_engine(settings.DATABASE_URL, echo=settings.SQLALCHEMY_ECHO)
 
 # Create session factory
 SessionLocal = sessionmaker(
@@ -24,8 +36,12 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
-# Base class for all models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """
+    Base class for all models.
+    Declare columns with Mapped[...] annotations and mapped_column().
+    """
+    pass
 
 
 def get_db():
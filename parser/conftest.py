@@ -0,0 +1,78 @@
+"""
+Pytest configuration and fixtures.
+Shared test utilities used across all parser tests.
+"""
+
+import csv
+import sys
+
+import pytest
+
+import parse_apple_health
+
+
+def workout_xml(date, workout_type='Running', duration='30', calories='250'):
+    """A single Workout element with an active energy statistic"""
+    return (
+        f'<Workout workoutActivityType="HKWorkoutActivityType{workout_type}" '
+        f'duration="{duration}" durationUnit="min" sourceName="Apple Watch" '
+        f'startDate="{date} 10:30:00 +0000" endDate="{date} 11:00:00 +0000">\n'
+        f' <WorkoutStatistics type="HKQuantityTypeIdentifierActiveEnergyBurned" '
+        f'sum="{calories}" unit="kcal"/>\n'
+        f'</Workout>\n'
+    )
+
+
+@pytest.fixture
+def make_export(tmp_path):
+    """
+    Factory writing an Apple Health export with the given workout dates.
+    Records are written before the workouts, as in real exports.
+    """
+    def _make_export(name, dates, records=5):
+        body = ''.join(
+            f'<Record type="HKQuantityTypeIdentifierStepCount" value="{i}"/>\n'
+            for i in range(records)
+        )
+        body += ''.join(workout_xml(date) for date in dates)
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<HealthData locale="en_US">\n{body}</HealthData>\n',
+            encoding='utf-8',
+        )
+        return path
+
+    return _make_export
+
+
+@pytest.fixture
+def run_parser(tmp_path, monkeypatch, capsys):
+    """
+    Run the parser's main() with the given arguments.
+    Returns (exit code, stdout, output folder).
+    """
+    output_dir = tmp_path / 'output'
+
+    def _run_parser(*args):
+        argv = ['parse_apple_health.py', '--output-dir', str(output_dir)]
+        monkeypatch.setattr(sys, 'argv', argv + [str(arg) for arg in args])
+        try:
+            parse_apple_health.main()
+            code = 0
+        except SystemExit as e:
+            code = e.code
+        return code, capsys.readouterr().out, output_dir
+
+    return _run_parser
+
+
+@pytest.fixture
+def read_rows():
+    """Read a workouts CSV (plain or .gz) as a list of rows, header included"""
+    def _read_rows(path):
+        with parse_apple_health.open_csv(path) as f:
+            return list(csv.reader(f))
+
+    return _read_rows
@@ -4,11 +4,27 @@ Parse Apple Health XML export and extract workout data to CSV
 Handles large files efficiently with streaming
 """
 
-import xml.etree.ElementTree as ET
+import argparse
 import csv
+import gzip
+import os
+import shutil
+import subprocess
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
+# Prefer lxml: it filters tags in C so only top-level elements reach
+# Python. Fall back to the stdlib parser if lxml isn't installed.
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
 # Mapping of Apple workout types to readable names
 WORKOUT_TYPE_MAP = {
     'HKWorkoutActivityTypeYoga': 'Yoga',
@@ -30,21 +46,44 @@ WORKOUT_TYPE_MAP = {
     'HKWorkoutActivityTypeHiking': 'Hiking',
     'HKWorkoutActivityTypeOther': 'Other',
 }
+# Intern names so the per-type stats dicts compare keys by identity
+WORKOUT_TYPE_MAP = {sys.intern(k): sys.intern(v) for k, v in WORKOUT_TYPE_MAP.items()}
+
+# Top-level export elements surfaced by lxml. Records come before Workouts
+# in real exports, so they must surface too in order to be freed as they
+# stream past; only Workouts are processed.
+STREAMED_TAGS = ('Workout', 'Record', 'Correlation', 'ActivitySummary')
+
+# WorkoutStatistics type that carries the calories burned
+ACTIVE_ENERGY_TYPE = 'HKQuantityTypeIdentifierActiveEnergyBurned'
+
+# Unit conversion tables (unknown units are passed through unchanged)
+_DURATION_TO_MIN = {'min': 1.0, 'sec': 1.0 / 60.0, 'hr': 60.0}
+# Apple typically uses kcal or kJ; divide rather than multiply so whole
+# kcal values stored as kJ don't truncate to one less
+_ENERGY_PER_KCAL = {'kcal': 1.0, 'kJ': 4.184}
+
+# CSV column order
+FIELDNAMES = ['Date', 'Time', 'Type', 'Duration (min)', 'Calories (kcal)', 'Source']
+
+# Live progress is only shown on an interactive terminal, every
+# PROGRESS_EVERY workouts (a power of two so it can be checked with a mask)
+_TTY = sys.stdout.isatty()
+PROGRESS_EVERY = 8192
+_PROGRESS_MASK = PROGRESS_EVERY - 1
+
+# Read the export in large chunks to cut down on read() syscalls
+INPUT_BUFFER_SIZE = 1 << 20
+# Rows buffered per csv.writer.writerows() call
+CSV_BATCH_SIZE = 1000
 
 def parse_duration(duration_str, duration_unit):
     """Convert duration to minutes"""
     if not duration_str or not duration_unit:
         return 0
     try:
-        duration = float(duration_str)
-        if duration_unit == 'min':
-            return int(duration)
-        elif duration_unit == 'sec':
-            return int(duration / 60)
-        elif duration_unit == 'hr':
-            return int(duration * 60)
-        return int(duration)
-    except:
+        return int(float(duration_str) * _DURATION_TO_MIN.get(duration_unit, 1.0))
+    except (TypeError, ValueError, OverflowError):
         return 0
 
 def parse_energy(energy_str, energy_unit):
@@ -52,178 +91,426 @@ def parse_energy(energy_str, energy_unit):
     if not energy_str:
         return 0
     try:
-        energy = float(energy_str)
-        # Apple typically uses kcal or kJ
-        if energy_unit == 'kJ':
-            return int(energy / 4.184)  # Convert kJ to kcal
-        return int(energy)
-    except:
+        return int(float(energy_str) / _ENERGY_PER_KCAL.get(energy_unit, 1.0))
+    except (TypeError, ValueError, OverflowError):
         return 0
 
-def extract_date(datetime_str):
-    """Extract just the date from datetime string"""
-    if not datetime_str:
-        return ''
+def open_csv(path, mode='r'):
+    """Open a workouts CSV as text, gzip-compressed when the path ends in .gz"""
+    if str(path).endswith('.gz'):
+        # Level 1: most of the size reduction for a fraction of the CPU
+        return gzip.open(path, mode + 't', compresslevel=1, newline='', encoding='utf-8')
+    return open(path, mode, newline='', encoding='utf-8')
+
+def sort_csv_by_date(path):
+    """Re-sort a workouts CSV by date, keeping same-day rows in file order"""
+    with open_csv(path) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = sorted(reader, key=itemgetter(0))
+
+    with open_csv(path, 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def _drain_workouts(events):
+    """Yield Workout elements from parse events, freeing memory as it goes"""
+    for event, elem in events:
+        if HAS_LXML:
+            if elem.tag == 'Workout':
+                yield elem
+            # Clear every streamed element and drop already-processed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        elif elem.tag == 'Workout':
+            yield elem
+            elem.clear()
+
+def iter_workouts(fh, errors=None):
+    """
+    Yield Workout elements from an Apple Health export opened in binary mode.
+    With lxml, XML errors don't raise; they are appended to errors if a list
+    is given, and the caller decides whether the partial result is usable.
+    """
+    if HAS_LXML:
+        # recover=True stops libxml2 raising on bad XML, but it usually yields
+        # nothing after a fatal error, so the Workouts that follow are lost.
+        # iterparse (unlike XMLPullParser.feed) keeps those errors in error_log
+        context = ET.iterparse(fh, events=('end',), tag=STREAMED_TAGS, recover=True, huge_tree=True)
+        yield from _drain_workouts(context)
+        if errors is not None:
+            errors.extend(str(error) for error in context.error_log.filter_from_errors())
+        return
+
+    parser = ET.XMLPullParser(events=('end',))
+    while True:
+        chunk = fh.read(INPUT_BUFFER_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from _drain_workouts(parser.read_events())
+
+    parser.close()
+    yield from _drain_workouts(parser.read_events())
+
+def iter_workout_records(input_file, errors=None):
+    """
+    Yield the raw fields of each Workout in an export as
+    (type, duration, duration unit, start date, source, energy sum, energy unit)
+    Recovered XML errors are appended to errors, as in iter_workouts.
+    """
+    with open(input_file, 'rb', buffering=INPUT_BUFFER_SIZE) as fh:
+        for elem in iter_workouts(fh, errors):
+            # Extract energy from WorkoutStatistics child element
+            energy_sum = energy_unit = None
+            for stat in elem.iterfind('WorkoutStatistics'):
+                if stat.get('type') == ACTIVE_ENERGY_TYPE:
+                    energy_sum = stat.get('sum', '0')
+                    energy_unit = stat.get('unit', 'kcal')
+                    break  # Found the energy, stop looking
+
+            yield (
+                elem.get('workoutActivityType', 'Unknown'),
+                elem.get('duration', '0'),
+                elem.get('durationUnit', 'min'),
+                elem.get('startDate', ''),
+                elem.get('sourceName', 'Unknown'),
+                energy_sum,
+                energy_unit,
+            )
+
+def iter_xmlstarlet_records(input_file, errors=None):
+    """
+    Yield the same records as iter_workout_records, extracted by xmlstarlet.
+    Only Workouts with an active energy statistic are selected. Output lines
+    that can't be split into the expected fields (e.g. a value containing a
+    tab) are skipped and reported through errors, like XML errors.
+    """
+    stat = f'WorkoutStatistics[@type="{ACTIVE_ENERGY_TYPE}"][1]'
+    fields = ['@workoutActivityType', '@duration', '@durationUnit', '@startDate',
+              '@sourceName', f'{stat}/@sum', f'{stat}/@unit']
+    cmd = ['xmlstarlet', 'sel', '-T', '-t', '-m', f'//Workout[{stat}]']
+    for i, field in enumerate(fields):
+        if i:
+            cmd += ['-o', '\t']
+        cmd += ['-v', field]
+    cmd += ['-n', str(input_file)]
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, encoding='utf-8') as proc:
+        for line_number, line in enumerate(proc.stdout, 1):
+            values = line.rstrip('\n').split('\t')
+            if len(values) != len(fields):
+                if errors is not None:
+                    errors.append(
+                        f"{input_file}: xmlstarlet output line {line_number} has "
+                        f"{len(values)} fields, expected {len(fields)}"
+                    )
+                continue
+            activity_type, duration, duration_unit, start_date, source, energy_sum, energy_unit = values
+            yield (
+                activity_type or 'Unknown',
+                duration or '0',
+                duration_unit or 'min',
+                start_date,
+                source or 'Unknown',
+                energy_sum,
+                energy_unit or 'kcal',
+            )
+
+    if proc.returncode:
+        raise RuntimeError(f"xmlstarlet exited with status {proc.returncode}")
+
+def parse_workouts(input_file, output_file, fast=False, progress=_TTY):
+    """
+    Parse one Apple Health export into a workouts CSV.
+    Rows are written in file order; returns the statistics needed to
+    report on them and to decide whether the CSV must be re-sorted.
+    With fast=True the fields are extracted by xmlstarlet instead of lxml.
+    Live progress is written to stdout when progress is true.
+    """
+    workout_count = 0
+    total_calories = 0
+    total_duration = 0
+    type_counts = defaultdict(int)
+    type_calories = defaultdict(int)
+    # Apple exports are usually chronological; only re-sort when they aren't
+    first_date = ''
+    last_date = ''
+    needs_sort = False
+    xml_errors = []
+
+    if fast:
+        records = iter_xmlstarlet_records(input_file, xml_errors)
+    else:
+        records = iter_workout_records(input_file, xml_errors)
+
+    # Stream rows straight to CSV instead of holding every workout in memory
+    shown_progress = False
     try:
-        # Format: "2024-01-15 10:30:45 +0000"
-        return datetime_str.split(' ')[0]
-    except:
-        return datetime_str
-
-def extract_time(datetime_str):
-    """Extract just the time from datetime string"""
-    if not datetime_str:
-        return ''
+        with open_csv(output_file, 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            batch = []
+
+            for activity_type, duration, duration_unit, start_date, source, energy_sum, energy_unit in records:
+                duration_min = parse_duration(duration, duration_unit)
+                calories = parse_energy(energy_sum, energy_unit)
+
+                # Extract date and time by position
+                # Format: "2024-01-15 10:30:45 +0000"
+                date = start_date[:10] if len(start_date) >= 10 else ''
+                time = start_date[11:19] if len(start_date) >= 19 else ''
+
+                # Only include workouts with calories data and valid dates
+                if calories > 0 and date:
+                    activity_type = sys.intern(activity_type)
+                    workout_type = WORKOUT_TYPE_MAP.get(activity_type, activity_type)
+
+                    batch.append((date, time, workout_type, duration_min, calories, source))
+                    if len(batch) >= CSV_BATCH_SIZE:
+                        writer.writerows(batch)
+                        batch.clear()
+
+                    if date < last_date:
+                        needs_sort = True
+                    elif not first_date:
+                        first_date = date
+                    last_date = date
+
+                    workout_count += 1
+                    total_calories += calories
+                    total_duration += duration_min
+                    type_counts[workout_type] += 1
+                    type_calories[workout_type] += calories
+
+                    if progress and not workout_count & _PROGRESS_MASK:
+                        sys.stdout.write(f"\r✓ Processed {workout_count} workouts...")
+                        sys.stdout.flush()
+                        shown_progress = True
+
+            writer.writerows(batch)
+    finally:
+        # End the in-place progress line so later messages start on their own
+        if shown_progress:
+            sys.stdout.write("\n")
+
+    return {
+        'count': workout_count,
+        'calories': total_calories,
+        'duration': total_duration,
+        'type_counts': type_counts,
+        'type_calories': type_calories,
+        'first_date': first_date,
+        'last_date': last_date,
+        'needs_sort': needs_sort,
+        'xml_errors': xml_errors,
+    }
+
+def _parse_one(job):
+    """
+    Worker entry point: parse one (input, output, fast, progress) job.
+    Returns (stats, None) or (None, error message); lxml errors can't be
+    pickled back to the parent process, so they are reported as text.
+    """
+    input_file, output_file, fast, progress = job
     try:
-        # Format: "2024-01-15 10:30:45 +0000"
-        parts = datetime_str.split(' ')
-        if len(parts) >= 2:
-            return parts[1]
-        return ''
-    except:
-        return ''
+        return parse_workouts(input_file, output_file, fast, progress), None
+    except ET.ParseError as e:
+        return None, f"XML Parse Error in {input_file}: {e}"
+    except OSError as e:
+        return None, f"File error: {e}"
+    except Exception as e:
+        return None, f"Unexpected error in {input_file}: {e}"
+
+def merge_stats(results):
+    """Combine per-input statistics, in input order"""
+    merged = {
+        'count': 0,
+        'calories': 0,
+        'duration': 0,
+        'type_counts': defaultdict(int),
+        'type_calories': defaultdict(int),
+        'last_date': '',
+        'needs_sort': False,
+        'xml_errors': [],
+    }
+    for stats in results:
+        merged['xml_errors'] += stats['xml_errors']
+        if not stats['count']:
+            continue
+        merged['count'] += stats['count']
+        merged['calories'] += stats['calories']
+        merged['duration'] += stats['duration']
+        for wtype, count in stats['type_counts'].items():
+            merged['type_counts'][wtype] += count
+        for wtype, calories in stats['type_calories'].items():
+            merged['type_calories'][wtype] += calories
+        # Concatenated parts also need sorting if they overlap in time
+        if stats['needs_sort'] or stats['first_date'] < merged['last_date']:
+            merged['needs_sort'] = True
+        merged['last_date'] = max(merged['last_date'], stats['last_date'])
+    return merged
+
+def merge_csv_parts(part_files, output_file):
+    """Concatenate per-input CSVs into one file with a single header, removing the parts"""
+    with open_csv(output_file, 'w') as out:
+        for i, part in enumerate(part_files):
+            with open_csv(part) as f:
+                if i:
+                    f.readline()  # Skip repeated header
+                shutil.copyfileobj(f, out)
+            part.unlink()
 
 def main():
-    # Get input file
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-    else:
-        input_file = 'export.xml'
-
-    input_path = Path(input_file)
-    if not input_path.exists():
-        print(f"❌ Error: File '{input_file}' not found")
+    parser = argparse.ArgumentParser(
+        description='Extract workouts from Apple Health XML exports to CSV'
+    )
+    parser.add_argument(
+        'inputs', nargs='*', default=['export.xml'],
+        help='export XML files, or directories containing them (default: export.xml); '
+             'multiple files are parsed in parallel and combined'
+    )
+    parser.add_argument(
+        '--fast', action='store_true',
+        help='extract fields with xmlstarlet when it is installed; it loads the '
+             'whole file into memory and stops at the first XML error'
+    )
+    parser.add_argument(
+        '--output-dir', default='/app/output',
+        help='folder to write the CSV to (default: /app/output)'
+    )
+    parser.add_argument(
+        '--gzip', action='store_true',
+        help='write a gzip-compressed CSV (<name>_workouts.csv.gz)'
+    )
+    parser.add_argument(
+        '--recover', action='store_true',
+        help='keep the workouts that could be read instead of failing on XML '
+             'errors (lxml or --fast only); the output will be incomplete'
+    )
+    args = parser.parse_args()
+
+    fast = args.fast
+    if fast and shutil.which('xmlstarlet') is None:
+        print("⚠️  xmlstarlet not found, using the standard parser")
+        fast = False
+
+    # Collect input files
+    input_files = []
+    for input_arg in args.inputs:
+        input_path = Path(input_arg)
+        if not input_path.exists():
+            print(f"❌ Error: File '{input_arg}' not found")
+            sys.exit(1)
+        if input_path.is_dir():
+            input_files.extend(sorted(input_path.glob('*.xml')))
+        else:
+            input_files.append(input_path)
+
+    if not input_files:
+        print(f"❌ Error: No XML files found in {', '.join(args.inputs)}")
         sys.exit(1)
 
     # Create output directory if it doesn't exist
-    output_dir = Path('/app/output')
+    output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    output_file = output_dir / (input_path.stem + '_workouts.csv')
+    output_stem = Path(args.inputs[0]).stem if len(args.inputs) == 1 else 'combined'
+    output_file = output_dir / (output_stem + ('_workouts.csv.gz' if args.gzip else '_workouts.csv'))
 
     print(f"📊 Parsing Apple Health XML...")
-    print(f"📁 Input: {input_file}")
+    print(f"📁 Input: {', '.join(str(path) for path in input_files)}")
     print(f"💾 Output: {output_file}")
     print(f"⏳ This may take a few minutes for large files...\n")
 
-    workouts = []
-    error_count = 0
+    if len(input_files) == 1:
+        part_files = [output_file]
+        results = [_parse_one((input_files[0], output_file, fast, _TTY))]
+    else:
+        # Parse each file in its own process, then stitch the CSVs together
+        part_files = [
+            output_dir / f"{output_stem}_workouts.part{i}.csv"
+            for i in range(len(input_files))
+        ]
+        workers = min(len(input_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers would overwrite each other's progress line, so stay quiet
+            jobs = [(path, part, fast, False) for path, part in zip(input_files, part_files)]
+            results = list(executor.map(_parse_one, jobs))
+
+    errors = [error for stats, error in results if error]
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        # Don't leave partial CSVs behind
+        for part in part_files:
+            part.unlink(missing_ok=True)
+        sys.exit(1)
 
-    try:
-        # Parse XML with iterative parsing to handle large files
-        context = ET.iterparse(input_file, events=('end',))
+    stats = merge_stats([stats for stats, error in results])
 
-        for event, elem in context:
-            if elem.tag == 'Workout':
-                try:
-                    # Extract workout-level attributes
-                    activity_type = elem.get('workoutActivityType', 'Unknown')
-                    duration = elem.get('duration', '0')
-                    duration_unit = elem.get('durationUnit', 'min')
-                    start_date = elem.get('startDate', '')
-                    end_date = elem.get('endDate', '')
-                    source = elem.get('sourceName', 'Unknown')
-
-                    # Parse duration
-                    duration_min = parse_duration(duration, duration_unit)
-
-                    # Extract energy from WorkoutStatistics child element
-                    calories = 0
-                    for stat in elem.findall('WorkoutStatistics'):
-                        stat_type = stat.get('type', '')
-                        if stat_type == 'HKQuantityTypeIdentifierActiveEnergyBurned':
-                            energy_sum = stat.get('sum', '0')
-                            energy_unit = stat.get('unit', 'kcal')
-                            calories = parse_energy(energy_sum, energy_unit)
-                            break  # Found the energy, stop looking
-
-                    # Extract date and time
-                    date = extract_date(start_date)
-                    time = extract_time(start_date)
-
-                    # Only include workouts with calories data and valid dates
-                    if calories > 0 and date:
-                        workout_type = WORKOUT_TYPE_MAP.get(activity_type, activity_type)
-
-                        workouts.append({
-                            'Date': date,
-                            'Time': time,
-                            'Type': workout_type,
-                            'Duration (min)': duration_min,
-                            'Calories (kcal)': calories,
-                            'Source': source,
-                            'Raw Type': activity_type
-                        })
-
-                        if len(workouts) % 100 == 0:
-                            print(f"✓ Processed {len(workouts)} workouts...")
-
-                    # Clear element to free memory
-                    elem.clear()
-
-                except Exception as e:
-                    error_count += 1
-                    if error_count < 10:  # Only print first few errors
-                        print(f"⚠️  Error parsing workout: {e}")
-
-    except ET.ParseError as e:
-        print(f"❌ XML Parse Error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+    # XML errors (or unreadable xmlstarlet lines) mean workouts are missing
+    xml_errors = stats['xml_errors']
+    if xml_errors and not args.recover:
+        print(f"❌ {len(xml_errors)} XML errors found; the output would be incomplete")
+        print(f"   First error: {xml_errors[0]}")
+        print("⚠️  Re-run with --recover to keep the workouts read before the error")
+        for part in part_files:
+            part.unlink(missing_ok=True)
         sys.exit(1)
 
-    if not workouts:
+    if len(input_files) > 1:
+        try:
+            merge_csv_parts(part_files, output_file)
+        except OSError as e:
+            print(f"❌ Error writing CSV: {e}")
+            sys.exit(1)
+
+    workout_count = stats['count']
+    total_calories = stats['calories']
+    total_duration = stats['duration']
+    type_counts = stats['type_counts']
+    type_calories = stats['type_calories']
+
+    if xml_errors:
+        print(f"⚠️  {len(xml_errors)} XML errors recovered; output may be incomplete")
+        print(f"   First error: {xml_errors[0]}")
+
+    if not workout_count:
+        output_file.unlink(missing_ok=True)
         print("❌ No workouts found in the XML file")
         print("⚠️  Make sure your export.xml contains Workout elements with HKQuantityTypeIdentifierActiveEnergyBurned statistics")
         sys.exit(1)
 
     # Sort by date
-    workouts.sort(key=lambda x: x['Date'])
-
-    # Write to CSV
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['Date', 'Time', 'Type', 'Duration (min)', 'Calories (kcal)', 'Source']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for workout in workouts:
-                row = {k: workout[k] for k in fieldnames}
-                writer.writerow(row)
-
-        print(f"\n✅ Success! Extracted {len(workouts)} workouts")
-        print(f"📊 Statistics:")
-
-        # Calculate stats
-        total_calories = sum(w['Calories (kcal)'] for w in workouts)
-        total_duration = sum(w['Duration (min)'] for w in workouts)
-        avg_calories = total_calories / len(workouts)
-
-        print(f"   • Total Workouts: {len(workouts)}")
-        print(f"   • Total Calories: {total_calories:,} kcal")
-        print(f"   • Average Calories: {avg_calories:.0f} kcal")
-        print(f"   • Total Duration: {total_duration:,} minutes ({total_duration//60} hours)")
-
-        # Workout type breakdown
-        type_counts = {}
-        type_calories = {}
-        for w in workouts:
-            wtype = w['Type']
-            type_counts[wtype] = type_counts.get(wtype, 0) + 1
-            type_calories[wtype] = type_calories.get(wtype, 0) + w['Calories (kcal)']
-
-        print(f"   • Workout Types:")
-        for wtype, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-            total_cal = type_calories[wtype]
-            avg_cal = total_cal / count
-            print(f"     - {wtype}: {count} workouts, {total_cal:,} kcal total, {avg_cal:.0f} kcal avg")
-
-        print(f"\n💾 File saved: {output_file}")
-        print(f"📤 You can now upload this CSV to the web app!")
-
-    except Exception as e:
-        print(f"❌ Error writing CSV: {e}")
-        sys.exit(1)
+    if stats['needs_sort']:
+        try:
+            sort_csv_by_date(output_file)
+        except Exception as e:
+            print(f"❌ Error writing CSV: {e}")
+            sys.exit(1)
+
+    print(f"\n✅ Success! Extracted {workout_count} workouts")
+    print(f"📊 Statistics:")
+
+    avg_calories = total_calories / workout_count
+
+    print(f"   • Total Workouts: {workout_count}")
+    print(f"   • Total Calories: {total_calories:,} kcal")
+    print(f"   • Average Calories: {avg_calories:.0f} kcal")
+    print(f"   • Total Duration: {total_duration:,} minutes ({total_duration//60} hours)")
+
+    # Workout type breakdown
+    print(f"   • Workout Types:")
+    for wtype, count in sorted(type_counts.items(), key=itemgetter(1), reverse=True):
+        total_cal = type_calories[wtype]
+        avg_cal = total_cal / count
+        print(f"     - {wtype}: {count} workouts, {total_cal:,} kcal total, {avg_cal:.0f} kcal avg")
+
+    print(f"\n💾 File saved: {output_file}")
+    print(f"📤 You can now upload this CSV to the web app!")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
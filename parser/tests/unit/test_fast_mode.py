@@ -0,0 +1,48 @@
+"""
+Tests for --fast, which extracts workout fields with xmlstarlet.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from parse_apple_health import iter_xmlstarlet_records
+
+DATES = ['2024-01-03', '2024-01-01', '2024-01-02']
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(shutil.which('xmlstarlet') is None, reason='xmlstarlet not installed')
+def test_fast_matches_default(make_export, run_parser):
+    path = make_export('export.xml', DATES)
+
+    code, out, output_dir = run_parser(path)
+    assert code == 0
+    expected = (output_dir / 'export_workouts.csv').read_bytes()
+
+    code, out, output_dir = run_parser('--fast', path)
+    assert code == 0
+    assert 'xmlstarlet not found' not in out
+    assert (output_dir / 'export_workouts.csv').read_bytes() == expected
+
+
+@pytest.mark.unit
+def test_unsplittable_lines_are_reported(tmp_path, monkeypatch):
+    # Stand-in for xmlstarlet whose second line has an extra tab-separated field
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    script = bin_dir / 'xmlstarlet'
+    script.write_text(
+        '#!/bin/sh\n'
+        "printf 'HKWorkoutActivityTypeRunning\\t30\\tmin\\t2024-01-01 10:00:00 +0000\\tWatch\\t250\\tkcal\\n'\n"
+        "printf 'HKWorkoutActivityTypeRunning\\t30\\tmin\\t2024-01-02 10:00:00 +0000\\tMy\\tWatch\\t250\\tkcal\\n'\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    errors = []
+
+    records = list(iter_xmlstarlet_records('export.xml', errors))
+
+    assert [record[3] for record in records] == ['2024-01-01 10:00:00 +0000']
+    assert errors == ['export.xml: xmlstarlet output line 2 has 8 fields, expected 7']
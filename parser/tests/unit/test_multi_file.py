@@ -0,0 +1,109 @@
+"""
+Tests for parsing several exports in parallel and combining the results.
+"""
+
+import pytest
+
+from parse_apple_health import FIELDNAMES, merge_csv_parts, merge_stats
+
+
+def part_stats(dates, calories=100):
+    """Statistics as returned by parse_workouts for a part with these dates, in file order"""
+    return {
+        'count': len(dates),
+        'calories': calories * len(dates),
+        'duration': 30 * len(dates),
+        'type_counts': {'Running': len(dates)} if dates else {},
+        'type_calories': {'Running': calories * len(dates)} if dates else {},
+        'first_date': dates[0] if dates else '',
+        'last_date': dates[-1] if dates else '',
+        'needs_sort': dates != sorted(dates),
+        'xml_errors': [],
+    }
+
+
+@pytest.mark.unit
+def test_merge_stats_sums_parts():
+    merged = merge_stats([part_stats(['2024-01-01', '2024-01-02']), part_stats(['2024-01-03'])])
+
+    assert merged['count'] == 3
+    assert merged['calories'] == 300
+    assert merged['duration'] == 90
+    assert merged['type_counts'] == {'Running': 3}
+    assert merged['type_calories'] == {'Running': 300}
+    assert not merged['needs_sort']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('parts', [
+    # Second part starts before the first one ends
+    [['2024-01-01', '2024-01-05'], ['2024-01-03']],
+    # A part that is out of order on its own
+    [['2024-01-01'], ['2024-01-04', '2024-01-02']],
+    # Overlap with an earlier part, not just the previous one
+    [['2024-01-01', '2024-01-09'], ['2024-01-10'], ['2024-01-05']],
+])
+def test_merge_stats_detects_overlap(parts):
+    assert merge_stats([part_stats(dates) for dates in parts])['needs_sort']
+
+
+@pytest.mark.unit
+def test_merge_stats_ignores_empty_parts():
+    merged = merge_stats([
+        part_stats(['2024-01-01', '2024-01-02']),
+        part_stats([]),
+        part_stats(['2024-01-03']),
+    ])
+
+    assert merged['count'] == 3
+    assert merged['last_date'] == '2024-01-03'
+    assert not merged['needs_sort']
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('suffix', ['.csv', '.csv.gz'])
+def test_merge_csv_parts_keeps_one_header(suffix, tmp_path, read_rows):
+    header = ','.join(FIELDNAMES) + '\r\n'
+    parts = []
+    for i, rows in enumerate([['a'], [], ['b', 'c']]):
+        part = tmp_path / f'part{i}.csv'
+        part.write_text(header + ''.join(f'{row}\r\n' for row in rows), encoding='utf-8')
+        parts.append(part)
+    output_file = tmp_path / f'out{suffix}'
+
+    merge_csv_parts(parts, output_file)
+
+    assert read_rows(output_file) == [FIELDNAMES, ['a'], ['b'], ['c']]
+    assert not any(part.exists() for part in parts)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('gzip', [False, True])
+def test_multiple_exports_match_single_export(gzip, make_export, run_parser, read_rows, tmp_path):
+    # Overlapping date ranges, plus an export with records but no workouts
+    first = ['2024-01-01', '2024-01-03', '2024-01-05']
+    second = ['2024-01-02', '2024-01-04']
+    make_export('parts/a.xml', first)
+    make_export('parts/b.xml', second)
+    make_export('parts/c.xml', [])
+    single = make_export('all.xml', first + second)
+    flags = ['--gzip'] if gzip else []
+    suffix = '_workouts.csv.gz' if gzip else '_workouts.csv'
+
+    code, out, output_dir = run_parser(*flags, single)
+    assert code == 0
+    expected_file = output_dir / f'all{suffix}'
+    assert [row[0] for row in read_rows(expected_file)[1:]] == sorted(first + second)
+
+    for inputs, name in [
+        ([tmp_path / 'parts/a.xml', tmp_path / 'parts/b.xml', tmp_path / 'parts/c.xml'], 'combined'),
+        ([tmp_path / 'parts'], 'parts'),
+    ]:
+        code, out, output_dir = run_parser(*flags, *inputs)
+        assert code == 0
+        assert 'Success! Extracted 5 workouts' in out
+        output_file = output_dir / f'{name}{suffix}'
+        assert read_rows(output_file) == read_rows(expected_file)
+        if not gzip:
+            assert output_file.read_bytes() == expected_file.read_bytes()
+        assert not list(output_dir.glob('*.part*'))
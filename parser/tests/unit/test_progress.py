@@ -0,0 +1,27 @@
+"""
+Tests for the live progress line written while parsing.
+"""
+
+import pytest
+
+import parse_apple_health
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('progress', [True, False])
+def test_progress_line_is_terminated(progress, make_export, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(parse_apple_health, '_PROGRESS_MASK', 1)
+    dates = [f'2024-01-{day:02d}' for day in range(1, 6)]
+
+    stats = parse_apple_health.parse_workouts(
+        make_export('export.xml', dates), tmp_path / 'out.csv', progress=progress
+    )
+
+    out = capsys.readouterr().out
+    assert stats['count'] == 5
+    if progress:
+        # Progress overwrites itself with \r; later messages need a fresh line
+        assert '\r✓ Processed 4 workouts...' in out
+        assert out.endswith('\n')
+    else:
+        assert out == ''
@@ -0,0 +1,69 @@
+"""
+Tests for malformed exports: the parser must not report partial output as
+a success unless --recover is given.
+"""
+
+import pytest
+
+from parse_apple_health import HAS_LXML
+
+DATES = [f'2024-01-{day:02d}' for day in range(1, 11)]
+
+requires_lxml = pytest.mark.skipif(not HAS_LXML, reason='--recover needs lxml')
+
+
+@pytest.fixture
+def truncated_export(make_export):
+    """Export cut off in the middle of the 7th workout"""
+    path = make_export('truncated.xml', DATES)
+    text = path.read_text(encoding='utf-8')
+    cut = text.index('<Workout', text.index(DATES[6]) - 200)
+    path.write_text(text[:cut + 60], encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def corrupted_export(make_export):
+    """Export with a malformed start tag before the 6th workout"""
+    path = make_export('corrupted.xml', DATES)
+    text = path.read_text(encoding='utf-8')
+    bad = text.index('<Workout', text.index(DATES[5]) - 200)
+    path.write_text(text[:bad] + '<Workout foo="1" <<bad>\n' + text[bad:], encoding='utf-8')
+    return path
+
+
+@pytest.mark.unit
+def test_clean_export_succeeds(make_export, run_parser, read_rows):
+    code, out, output_dir = run_parser(make_export('export.xml', DATES))
+
+    assert code == 0
+    assert 'Success! Extracted 10 workouts' in out
+    assert 'XML error' not in out
+    assert len(read_rows(output_dir / 'export_workouts.csv')) == 1 + len(DATES)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('export', ['truncated_export', 'corrupted_export'])
+def test_malformed_export_fails(export, request, run_parser):
+    code, out, output_dir = run_parser(request.getfixturevalue(export))
+
+    assert code == 1
+    assert 'Success' not in out
+    assert not list(output_dir.glob('*.csv'))
+
+
+@pytest.mark.unit
+@requires_lxml
+@pytest.mark.parametrize('export, kept', [
+    ('truncated_export', 6),
+    ('corrupted_export', 5),
+])
+def test_malformed_export_with_recover(export, kept, request, run_parser, read_rows):
+    path = request.getfixturevalue(export)
+    code, out, output_dir = run_parser('--recover', path)
+
+    assert code == 0
+    assert 'XML errors recovered; output may be incomplete' in out
+    assert f'Success! Extracted {kept} workouts' in out
+    rows = read_rows(output_dir / f'{path.stem}_workouts.csv')
+    assert [row[0] for row in rows[1:]] == DATES[:kept]